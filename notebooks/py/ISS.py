@@ -262,7 +262,8 @@ GENE1 = 'HER2'
 GENE2 = 'VIM'
 
 rgb = np.zeros(registered_imgs.tile_shape + (3,))
-nuclei_numpy = rcz_max_projector.run(nuclei)._squeezed_numpy(Axes.ROUND, Axes.CH, Axes.ZPLANE)
+# nuclei was already max-projected over (r, c, z) for segmentation above
+nuclei_numpy = nuclei._squeezed_numpy(Axes.ROUND, Axes.CH, Axes.ZPLANE)
 rgb[:,:,0] = nuclei_numpy
 dots_numpy = rcz_max_projector.run(dots)._squeezed_numpy(Axes.ROUND, Axes.CH, Axes.ZPLANE)
 rgb[:,:,1] = dots_numpy
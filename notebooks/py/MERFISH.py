@@ -200,7 +200,10 @@ result_counts = pd.Series(counts, index=genes)
 
 tmp = pd.concat([result_counts, benchmark_counts], join='inner', axis=1).values
 
-r = np.corrcoef(tmp[:, 1], tmp[:, 0])[0, 1]
+# pearson correlation between benchmark and starfish counts
+dx = tmp[:, 1] - tmp[:, 1].mean()
+dy = tmp[:, 0] - tmp[:, 0].mean()
+r = (dx @ dy) / np.sqrt((dx @ dx) * (dy @ dy))
 x = np.linspace(50, 2000)
 f, ax = plt.subplots(figsize=(6, 6))
 ax.scatter(tmp[:, 1], tmp[:, 0], 50, zorder=2)
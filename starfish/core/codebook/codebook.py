@@ -617,30 +617,6 @@ class Codebook(xr.DataArray):
 
         """
 
-        def _view_row_as_element(array: np.ndarray) -> np.ndarray:
-            """view an entire code as a single element
-
-            This view allows vectors (codes) to be compared for equality without need for multiple
-            comparisons by casting the data in each code to a structured dtype that registers as
-            a single value
-
-            Parameters
-            ----------
-            array : np.ndarray
-                2-dimensional numpy array of shape (n_observations, (n_channel * n_round)) where
-                observations may be either features or codes.
-
-            Returns
-            -------
-            np.ndarray :
-                1-dimensional vector of shape n_observations
-
-            """
-            nrows, ncols = array.shape
-            dtype = {'names': ['f{}'.format(i) for i in range(ncols)],
-                     'formats': ncols * [array.dtype]}
-            return array.view(dtype)
-
         self._validate_decode_intensity_input_matches_codebook_shape(intensities)
 
         # add empty metadata fields and return
@@ -661,14 +637,21 @@ class Codebook(xr.DataArray):
         round_intensities = intensities.sum(Axes.CH.value)
         distance = 1 - (max_intensities / round_intensities).mean(Axes.ROUND.value)
 
-        a = _view_row_as_element(codes.values.reshape(self.shape[0], -1))
-        b = _view_row_as_element(max_channels.values.reshape(intensities.shape[0], -1))
-
-        targets = np.full(intensities.shape[0], fill_value=np.nan, dtype=object)
+        # label every distinct per-round max channel pattern, across both the codes and the
+        # features, in a single vectorized pass. A feature decodes to the target whose code
+        # shares its label.
+        code_patterns = codes.values.reshape(self.shape[0], -1)
+        feature_patterns = max_channels.values.reshape(intensities.shape[0], -1)
+        _, pattern_labels = np.unique(
+            np.concatenate([code_patterns, feature_patterns]), axis=0, return_inverse=True)
+        pattern_labels = pattern_labels.ravel()
+        code_labels = pattern_labels[:code_patterns.shape[0]]
+        feature_labels = pattern_labels[code_patterns.shape[0]:]
 
         # decode the intensities
-        for i in np.arange(codes.shape[0]):
-            targets[np.where(a[i] == b)[0]] = codes[Features.TARGET][i]
+        targets_by_label = np.full(pattern_labels.max() + 1, fill_value=np.nan, dtype=object)
+        targets_by_label[code_labels] = codes[Features.TARGET].values
+        targets = targets_by_label[feature_labels]
 
         # a code passes filters if it decodes successfully
         passes_filters = ~pd.isnull(targets)
@@ -37,35 +37,6 @@ class CallBases(FilterAlgorithm):
 
     _DEFAULT_TESTING_PARAMETERS = {"intensity_threshold": 0, "quality_threshold": 0}
 
-    def _vector_norm(self, x: xr.DataArray, dim: Axes, ord=None):
-        """
-        Calculates the vector norm across a given dimension of an xarray.
-
-        Parameters
-        ----------
-        x : xarray.DataArray
-            xarray to calcuate the norm.
-        dim : Axes
-            The dimension of the xarray to perform the norm across
-        ord : Optional[str]
-            Order of the norm to be applied. Leave none for L2 norm.
-
-            See numpy docs for details:
-            https://docs.scipy.org/doc/numpy/reference/generated/numpy.linalg.norm.html
-
-        Returns
-        -------
-        result : xarray.DataArray
-            The resulting xarray of norms
-
-        """
-        result = xr.apply_ufunc(
-            np.linalg.norm, x, input_core_dims=[[dim.value]],
-            kwargs={'ord': ord, 'axis': -1}
-        )
-
-        return result
-
     def _call_bases(
         self, image: xr.DataArray, intensity_threshold: float,
         quality_threshold: float
@@ -95,11 +66,16 @@ class CallBases(FilterAlgorithm):
         max_chan = image.argmax(dim=Axes.CH.value)
         max_values = image.max(dim=Axes.CH.value)
 
-        # Get the norms for each pixel
-        norms = self._vector_norm(x=image, dim=Axes.CH)
+        # Get the L2 norms for each pixel. einsum contracts the channel axis, squaring and summing
+        # the intensities in a single pass over the image.
+        norms = np.sqrt(xr.apply_ufunc(
+            partial(np.einsum, '...i,...i->...'), image, image,
+            input_core_dims=[[Axes.CH.value], [Axes.CH.value]],
+        ))
 
-        # Calculate the base qualities
-        base_qualities = max_values / norms
+        # Calculate the base qualities; pixels with no signal in any channel get a quality of 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            base_qualities = xr.where(norms > 0, max_values / norms, 0)
 
         # Filter the base call qualities
         base_qualities_filtered = xr.where(
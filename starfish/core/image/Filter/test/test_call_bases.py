@@ -1,3 +1,5 @@
+import warnings
+
 import numpy as np
 import pytest
 import xarray as xr
@@ -134,6 +136,23 @@ def test_call_bases(int_thresh: float, qual_thresh: float):
     xr.testing.assert_equal(base_image, expected_result)
 
 
+def test_call_bases_zero_pixel():
+
+    # A pixel with no signal in any channel has no base quality; it should be called as 0 without
+    # emitting any warnings.
+    cb = CallBases()
+    image_xr = make_multicolor_image()
+    image_xr[:, 1, 1] = 0
+    expected_result = make_expected_base_calls()
+    expected_result[:, 1, 1] = 0
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        base_image = cb._call_bases(image_xr, intensity_threshold=0, quality_threshold=0)
+
+    xr.testing.assert_equal(base_image, expected_result)
+
+
 def test_image_stack_base_call():
 
     # Get the test stack and expected result
@@ -252,9 +252,15 @@ class ImageStack:
         ImageStack :
             An ImageStack representing encapsulating the data from the TileSet.
         """
-        tile_data: TileCollectionData = TileSetData(tileset)
+        tile_data: TileCollectionData
         if crop_parameters is not None:
+            # drop the excluded tiles before the TileSet is parsed so they are never inspected.
+            tile_data = TileSetData(tileset, tilekey_filter=crop_parameters.filter_tilekeys)
+            # CroppedTileCollectionData.keys() filters again; that is a no-op for TileSetData and
+            # exists for backing collections that do not pre-filter.
             tile_data = CroppedTileCollectionData(tile_data, crop_parameters)
+        else:
+            tile_data = TileSetData(tileset)
         return ImageStack.from_tile_collection_data(tile_data)
 
     @classmethod
@@ -1,5 +1,5 @@
 from collections import OrderedDict
-from typing import Collection, List, Mapping, MutableSequence, Optional, Sequence, Tuple, Union
+from typing import Collection, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from slicedimage import Tile, TileSet
@@ -59,18 +59,22 @@ class CropParameters:
         """
         Filters tilekeys for those that should be included in the resulting ImageStack.
         """
-        results: MutableSequence[TileKey] = list()
-        for tilekey in tilekeys:
-            if self._permitted_rounds is not None and tilekey.round not in self._permitted_rounds:
-                continue
-            if self._permitted_chs is not None and tilekey.ch not in self._permitted_chs:
-                continue
-            if self._permitted_zplanes is not None and tilekey.z not in self._permitted_zplanes:
-                continue
-
-            results.append(tilekey)
-
-        return results
+        # hoist the attribute lookups out of the comprehension, which visits every tilekey in the
+        # collection.
+        permitted_rounds = self._permitted_rounds
+        permitted_chs = self._permitted_chs
+        permitted_zplanes = self._permitted_zplanes
+
+        if permitted_rounds is None and permitted_chs is None and permitted_zplanes is None:
+            return list(tilekeys)
+
+        return [
+            tilekey
+            for tilekey in tilekeys
+            if (permitted_rounds is None or tilekey.round in permitted_rounds)
+            and (permitted_chs is None or tilekey.ch in permitted_chs)
+            and (permitted_zplanes is None or tilekey.z in permitted_zplanes)
+        ]
 
     @staticmethod
     def _crop_axis(size: int, crop: Optional[Union[int, slice]]) -> Tuple[int, int]:
@@ -102,7 +106,8 @@ class CropParameters:
         else:
             stop = min(size, crop.stop)
 
-        return start, stop
+        # a crop that ends before it starts is empty.
+        return start, max(start, stop)
 
     @staticmethod
     def parse_aligned_groups(tileset: TileSet,
@@ -204,21 +209,13 @@ class CropParameters:
         """
         Given the shape of the original tile, return the shape of the cropped tile.
         """
-        output_x_shape = CropParameters._crop_axis(shape[Axes.X], self._x_slice)
-        output_y_shape = CropParameters._crop_axis(shape[Axes.Y], self._y_slice)
-        width = output_x_shape[1] - output_x_shape[0]
-        height = output_y_shape[1] - output_y_shape[0]
-
-        return {Axes.Y: height, Axes.X: width}
+        return self.specialize(shape).crop_shape()
 
     def crop_image(self, image: np.ndarray) -> np.ndarray:
         """
         Given the original image, return the cropped image.
         """
-        output_x_shape = CropParameters._crop_axis(image.shape[1], self._x_slice)
-        output_y_shape = CropParameters._crop_axis(image.shape[0], self._y_slice)
-
-        return image[output_y_shape[0]:output_y_shape[1], output_x_shape[0]:output_x_shape[1]]
+        return self.specialize({Axes.Y: image.shape[0], Axes.X: image.shape[1]}).crop_image(image)
 
     def crop_coordinates(
             self, coordinates: Mapping[Coordinates, Sequence[Number]],
@@ -227,12 +224,73 @@ class CropParameters:
         Given a mapping of coordinate to coordinate values, return a mapping of the coordinate to
         cropped coordinate values.
         """
-        output_x_shape = CropParameters._crop_axis(len(coordinates[Coordinates.X]), self._x_slice)
-        output_y_shape = CropParameters._crop_axis(len(coordinates[Coordinates.Y]), self._y_slice)
+        shape = {
+            Axes.Y: len(coordinates[Coordinates.Y]),
+            Axes.X: len(coordinates[Coordinates.X]),
+        }
+        return self.specialize(shape).crop_coordinates(coordinates)
+
+    def specialize(self, shape: Mapping[Axes, int]) -> "_SpecializedCrop":
+        """
+        Resolve these cropping parameters against a fixed tile shape.  All the tiles in a
+        TileCollectionData share the same shape, so the crop bounds can be computed once and reused
+        for every tile.
+        """
+        return _SpecializedCrop(
+            CropParameters._crop_axis(shape[Axes.Y], self._y_slice),
+            CropParameters._crop_axis(shape[Axes.X], self._x_slice),
+            shape,
+        )
+
+
+class _SpecializedCrop:
+    """The (y, x) bounds of a CropParameters crop, resolved for a single tile shape."""
+    def __init__(
+            self,
+            y_range: Tuple[int, int],
+            x_range: Tuple[int, int],
+            shape: Mapping[Axes, int],
+    ) -> None:
+        self.y_start, self.y_stop = y_range
+        self.x_start, self.x_stop = x_range
+        self._shape: Tuple[int, int] = (shape[Axes.Y], shape[Axes.X])
+        self._cropped_shape: Mapping[Axes, int] = {
+            Axes.Y: self.y_stop - self.y_start,
+            Axes.X: self.x_stop - self.x_start,
+        }
+        # True if the crop retains the entire (y, x) extent of a tile of the given shape.
+        self.is_identity = (y_range == (0, self._shape[0]) and x_range == (0, self._shape[1]))
+
+    def _check_shape(self, shape: Tuple[int, int]) -> None:
+        if shape != self._shape:
+            raise ValueError(
+                f"crop was resolved for tiles of shape {self._shape}, but was applied to a tile of "
+                f"shape {shape}")
+
+    def crop_shape(self) -> Mapping[Axes, int]:
+        """
+        Return the shape of the cropped tile.
+        """
+        return self._cropped_shape
 
+    def crop_image(self, image: np.ndarray) -> np.ndarray:
+        """
+        Given the original image, return the cropped image.
+        """
+        self._check_shape(image.shape[:2])
+        return image[self.y_start:self.y_stop, self.x_start:self.x_stop]
+
+    def crop_coordinates(
+            self, coordinates: Mapping[Coordinates, Sequence[Number]],
+    ) -> Mapping[Coordinates, Sequence[Number]]:
+        """
+        Given a mapping of coordinate to coordinate values, return a mapping of the coordinate to
+        cropped coordinate values.
+        """
+        self._check_shape((len(coordinates[Coordinates.Y]), len(coordinates[Coordinates.X])))
         return_coords = {
-            Coordinates.X: coordinates[Coordinates.X][output_x_shape[0]:output_x_shape[1]],
-            Coordinates.Y: coordinates[Coordinates.Y][output_y_shape[0]:output_y_shape[1]],
+            Coordinates.X: coordinates[Coordinates.X][self.x_start:self.x_stop],
+            Coordinates.Y: coordinates[Coordinates.Y][self.y_start:self.y_stop],
         }
 
         if Coordinates.Z in coordinates:
@@ -243,21 +301,21 @@ class CropParameters:
 
 class CroppedTileData(TileData):
     """Represent a cropped view of a TileData object."""
-    def __init__(self, tile_data: TileData, cropping_parameters: CropParameters):
+    def __init__(self, tile_data: TileData, crop: _SpecializedCrop):
         self.backing_tile_data = tile_data
-        self.cropping_parameters = cropping_parameters
+        self.crop = crop
 
     @property
     def tile_shape(self) -> Mapping[Axes, int]:
-        return self.cropping_parameters.crop_shape(self.backing_tile_data.tile_shape)
+        return self.crop.crop_shape()
 
     @property
     def numpy_array(self) -> np.ndarray:
-        return self.cropping_parameters.crop_image(self.backing_tile_data.numpy_array)
+        return self.crop.crop_image(self.backing_tile_data.numpy_array)
 
     @property
     def coordinates(self) -> Mapping[Coordinates, Sequence[Number]]:
-        return self.cropping_parameters.crop_coordinates(self.backing_tile_data.coordinates)
+        return self.crop.crop_coordinates(self.backing_tile_data.coordinates)
 
     @property
     def selector(self) -> Mapping[Axes, int]:
@@ -273,6 +331,7 @@ class CroppedTileCollectionData(TileCollectionData):
     ) -> None:
         self.backing_tile_collection_data = backing_tile_collection_data
         self.crop_parameters = crop_parameters
+        self._crop = crop_parameters.specialize(backing_tile_collection_data.tile_shape)
 
     def __getitem__(self, tilekey: TileKey) -> dict:
         return self.backing_tile_collection_data[tilekey]
@@ -282,20 +341,20 @@ class CroppedTileCollectionData(TileCollectionData):
 
     @property
     def tile_shape(self) -> Mapping[Axes, int]:
-        return self.crop_parameters.crop_shape(self.backing_tile_collection_data.tile_shape)
+        return self._crop.crop_shape()
 
     @property
     def extras(self) -> dict:
         return self.backing_tile_collection_data.extras
 
+    def _wrap_tile(self, tile_data: TileData) -> TileData:
+        # if the crop only selects rounds, channels, or zplanes, the tile is returned as-is.
+        if self._crop.is_identity:
+            return tile_data
+        return CroppedTileData(tile_data, self._crop)
+
     def get_tile_by_key(self, tilekey: TileKey) -> TileData:
-        return CroppedTileData(
-            self.backing_tile_collection_data.get_tile_by_key(tilekey),
-            self.crop_parameters,
-        )
+        return self._wrap_tile(self.backing_tile_collection_data.get_tile_by_key(tilekey))
 
     def get_tile(self, r: int, ch: int, z: int) -> TileData:
-        return CroppedTileData(
-            self.backing_tile_collection_data.get_tile(r, ch, z),
-            self.crop_parameters,
-        )
+        return self._wrap_tile(self.backing_tile_collection_data.get_tile(r, ch, z))
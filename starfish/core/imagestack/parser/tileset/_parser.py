@@ -1,7 +1,7 @@
 """
 This module parses and retains the extras metadata attached to TileSet extras.
 """
-from typing import Collection, Mapping, MutableMapping, Sequence, Tuple
+from typing import Callable, Collection, Mapping, MutableMapping, Optional, Sequence, Tuple
 
 import numpy as np
 from slicedimage import Tile, TileSet
@@ -77,8 +77,16 @@ class SlicedImageTile(TileData):
 class TileSetData(TileCollectionData):
     """
     This class presents a simpler API for accessing a TileSet and its constituent tiles.
+
+    If a tilekey_filter is provided, it is applied to the TileKeys of the TileSet before any tile
+    is inspected, and only the tiles it returns are retained.
     """
-    def __init__(self, tileset: TileSet) -> None:
+    def __init__(
+            self,
+            tileset: TileSet,
+            tilekey_filter: Optional[
+                Callable[[Collection[TileKey]], Collection[TileKey]]]=None,
+    ) -> None:
         self._tile_shape = tileset.default_tile_shape
 
         self.tiles: MutableMapping[TileKey, Tile] = dict()
@@ -89,9 +97,17 @@ class TileSetData(TileCollectionData):
                 zplane=tile.indices.get(Axes.ZPLANE, 0))
             self.tiles[key] = tile
 
-            # if we don't have the tile shape, then we peek at the tile and get its shape.
-            if self._tile_shape is None:
-                self._tile_shape = tile.tile_shape
+        if tilekey_filter is not None:
+            self.tiles = {tilekey: self.tiles[tilekey]
+                          for tilekey in tilekey_filter(self.tiles.keys())}
+
+        # if we don't have the tile shape, then we peek at a retained tile and get its shape.
+        if self._tile_shape is None:
+            if len(self.tiles) == 0:
+                raise ValueError(
+                    "Cannot determine the tile shape: the TileSet has no default_tile_shape and no "
+                    "tiles were retained")
+            self._tile_shape = next(iter(self.tiles.values())).tile_shape
 
         self._extras = tileset.extras
 
@@ -2,10 +2,14 @@
 These tests center around creating an ImageStack but selectively loading data from the original
 TileSet.
 """
+from typing import Optional
+
 import numpy as np
+import pytest
+from slicedimage import Tile, TileSet
 
 from starfish.core.experiment.builder.test.factories.unique_tiles import unique_data
-from starfish.core.types import Axes
+from starfish.core.types import Axes, Coordinates
 from .factories.unique_tiles import (
     unique_tiles_imagestack, X_COORDS, Y_COORDS, Z_COORDS,
 )
@@ -15,7 +19,10 @@ from .imagestack_test_utils import (
     verify_stack_data,
 )
 from ..imagestack import ImageStack
-from ..parser.crop import CropParameters
+from ..parser import TileKey
+from ..parser.crop import CropParameters, CroppedTileCollectionData, CroppedTileData
+from ..parser.numpy import NumpyData
+from ..parser.tileset import TileSetData
 
 
 NUM_FOV = 1
@@ -84,6 +91,135 @@ def test_crop_rcz():
         )
 
 
+def test_crop_rcz_serves_backing_tiles():
+    """A crop that does not restrict x/y should serve the backing tiles without wrapping them.  A
+    crop that does restrict x/y should wrap them.
+    """
+    data = np.zeros((NUM_ROUND, NUM_CH, NUM_ZPLANE, HEIGHT, WIDTH), dtype=np.float32)
+    index_labels = {Axes.ROUND: ROUND_LABELS, Axes.CH: CH_LABELS, Axes.ZPLANE: ZPLANE_LABELS}
+    backing_tile_data = NumpyData(data, index_labels, None)
+
+    crop_parameters = CropParameters(permitted_rounds=[1], x_slice=slice(None, WIDTH))
+    tile_data = CroppedTileCollectionData(backing_tile_data, crop_parameters)
+    tile = tile_data.get_tile(r=1, ch=0, z=0)
+    assert not isinstance(tile, CroppedTileData)
+    assert tile.numpy_array.shape == (HEIGHT, WIDTH)
+
+    crop_parameters = CropParameters(permitted_rounds=[1], x_slice=slice(10, 30))
+    tile_data = CroppedTileCollectionData(backing_tile_data, crop_parameters)
+    tile = tile_data.get_tile(r=1, ch=0, z=0)
+    assert isinstance(tile, CroppedTileData)
+    assert tile.numpy_array.shape == (HEIGHT, 20)
+
+
+@pytest.mark.parametrize(
+    "x_slice, y_slice, expected_x_range, expected_y_range",
+    [
+        (None, None, (0, WIDTH), (0, HEIGHT)),
+        (slice(None, None), slice(None, HEIGHT), (0, WIDTH), (0, HEIGHT)),
+        (slice(10, 30), slice(15, None), (10, 30), (15, HEIGHT)),
+        (slice(-20, None), slice(None, -10), (WIDTH - 20, WIDTH), (0, HEIGHT - 10)),
+        (slice(-100, 100), slice(5, -100), (0, WIDTH), (5, 5)),
+    ]
+)
+def test_specialize(x_slice, y_slice, expected_x_range, expected_y_range):
+    """Resolve a crop against a tile shape and verify the bounds, the cropped shape, the cropped
+    coordinates, and whether the crop is an identity crop.
+    """
+    crop_parameters = CropParameters(x_slice=x_slice, y_slice=y_slice)
+    crop = crop_parameters.specialize({Axes.Y: HEIGHT, Axes.X: WIDTH})
+
+    assert (crop.x_start, crop.x_stop) == expected_x_range
+    assert (crop.y_start, crop.y_stop) == expected_y_range
+
+    expected_shape = {
+        Axes.Y: expected_y_range[1] - expected_y_range[0],
+        Axes.X: expected_x_range[1] - expected_x_range[0],
+    }
+    assert crop.crop_shape() == expected_shape
+    assert crop_parameters.crop_shape({Axes.Y: HEIGHT, Axes.X: WIDTH}) == expected_shape
+    assert crop.is_identity == (
+        expected_x_range == (0, WIDTH) and expected_y_range == (0, HEIGHT))
+
+    image = np.arange(HEIGHT * WIDTH).reshape(HEIGHT, WIDTH)
+    expected_image = image[
+        expected_y_range[0]:expected_y_range[1], expected_x_range[0]:expected_x_range[1]]
+    assert crop.crop_image(image).shape == (expected_shape[Axes.Y], expected_shape[Axes.X])
+    assert np.array_equal(crop.crop_image(image), expected_image)
+    assert np.array_equal(crop_parameters.crop_image(image), expected_image)
+
+    coordinates = {
+        Coordinates.X: np.linspace(X_COORDS[0], X_COORDS[1], WIDTH),
+        Coordinates.Y: np.linspace(Y_COORDS[0], Y_COORDS[1], HEIGHT),
+        Coordinates.Z: Z_COORDS,
+    }
+    cropped_coordinates = crop.crop_coordinates(coordinates)
+    assert np.array_equal(
+        cropped_coordinates[Coordinates.X],
+        coordinates[Coordinates.X][expected_x_range[0]:expected_x_range[1]])
+    assert np.array_equal(
+        cropped_coordinates[Coordinates.Y],
+        coordinates[Coordinates.Y][expected_y_range[0]:expected_y_range[1]])
+    assert cropped_coordinates[Coordinates.Z] == Z_COORDS
+
+
+def test_specialize_rejects_mismatched_shape():
+    """A crop resolved for one tile shape should refuse to crop a tile of a different shape."""
+    crop = CropParameters(x_slice=slice(10, 30)).specialize({Axes.Y: HEIGHT, Axes.X: WIDTH})
+
+    with pytest.raises(ValueError):
+        crop.crop_image(np.zeros((HEIGHT, WIDTH + 1)))
+    with pytest.raises(ValueError):
+        crop.crop_coordinates({
+            Coordinates.X: np.linspace(X_COORDS[0], X_COORDS[1], WIDTH),
+            Coordinates.Y: np.linspace(Y_COORDS[0], Y_COORDS[1], HEIGHT - 1),
+        })
+
+
+def make_tileset(default_tile_shape: Optional[dict]) -> TileSet:
+    tileset = TileSet(
+        [Axes.X, Axes.Y, Axes.CH, Axes.ZPLANE, Axes.ROUND],
+        {Axes.ROUND: NUM_ROUND, Axes.CH: NUM_CH, Axes.ZPLANE: NUM_ZPLANE},
+        default_tile_shape,
+    )
+    for round_label in ROUND_LABELS:
+        for ch_label in CH_LABELS:
+            for zplane_label in ZPLANE_LABELS:
+                tile = Tile(
+                    {Coordinates.X: X_COORDS, Coordinates.Y: Y_COORDS, Coordinates.Z: Z_COORDS},
+                    {Axes.ROUND: round_label, Axes.CH: ch_label, Axes.ZPLANE: zplane_label},
+                )
+                tile.numpy_array = expected_data(round_label, ch_label, zplane_label)
+                tileset.add_tile(tile)
+    return tileset
+
+
+@pytest.mark.parametrize("default_tile_shape", [{Axes.Y: HEIGHT, Axes.X: WIDTH}, None])
+def test_tileset_data_tilekey_filter(default_tile_shape):
+    """Build a TileSetData with a tilekey filter.  Verify that only the permitted tiles are
+    retained, and that the tile shape is available whether or not the TileSet provides a default.
+    """
+    crop_parameters = CropParameters(permitted_rounds=[1], permitted_chs=[2, 3])
+    tile_data = TileSetData(
+        make_tileset(default_tile_shape), tilekey_filter=crop_parameters.filter_tilekeys)
+
+    assert set(tile_data.keys()) == {
+        TileKey(round=1, ch=ch_label, zplane=zplane_label)
+        for ch_label in (2, 3)
+        for zplane_label in ZPLANE_LABELS
+    }
+    assert tile_data.tile_shape[Axes.Y] == HEIGHT
+    assert tile_data.tile_shape[Axes.X] == WIDTH
+
+
+def test_tileset_data_tilekey_filter_retains_nothing():
+    """If the filter removes every tile and the TileSet has no default tile shape, the tile shape
+    cannot be determined."""
+    crop_parameters = CropParameters(permitted_rounds=[NUM_ROUND])
+    with pytest.raises(ValueError):
+        TileSetData(make_tileset(None), tilekey_filter=crop_parameters.filter_tilekeys)
+
+
 def test_crop_xy():
     """Build an imagestack that contains a crop in x/y.  Verify that the data is sliced correctly.
     """
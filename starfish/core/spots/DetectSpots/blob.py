@@ -34,7 +34,8 @@ class BlobDetector(DetectSpotsAlgorithm):
         detect larger blobs.
     num_sigma : int
         The number of intermediate values of standard deviations to consider
-        between `min_sigma` and `max_sigma`.
+        between `min_sigma` and `max_sigma`. Ignored by blob_dog, which spaces its
+        scales geometrically by skimage's default sigma ratio instead.
     threshold : float
         The absolute lower bound for scale space maxima. Local maxima smaller
         than thresh are ignored. Reduce this to detect blobs with less
@@ -74,7 +75,7 @@ class BlobDetector(DetectSpotsAlgorithm):
         self.measurement_function = self._get_measurement_function(measurement_type)
         try:
             self.detector_method = blob_detectors[detector_method]
-        except ValueError:
+        except KeyError:
             raise ValueError("Detector method must be one of {blob_log, blob_dog, blob_doh}")
 
     def image_to_spots(self, data_image: Union[np.ndarray, xr.DataArray]) -> SpotAttributes:
@@ -93,14 +94,18 @@ class BlobDetector(DetectSpotsAlgorithm):
 
         """
 
-        fitted_blobs_array: np.ndarray = self.detector_method(
-            data_image,
-            self.min_sigma,
-            self.max_sigma,
-            self.num_sigma,
-            self.threshold,
-            self.overlap
-        )
+        detector_kwargs = {
+            "min_sigma": self.min_sigma,
+            "max_sigma": self.max_sigma,
+            "threshold": self.threshold,
+            "overlap": self.overlap,
+        }
+        # blob_dog approximates the LoG scale space with differences of successive gaussians, so
+        # it takes a sigma_ratio between scales rather than a number of scales.
+        if self.detector_method is not blob_dog:
+            detector_kwargs["num_sigma"] = self.num_sigma
+
+        fitted_blobs_array: np.ndarray = self.detector_method(data_image, **detector_kwargs)
 
         if fitted_blobs_array.shape[0] == 0:
             return SpotAttributes.empty(extra_fields=['intensity', 'spot_id'])
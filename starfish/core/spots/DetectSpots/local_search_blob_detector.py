@@ -12,7 +12,7 @@ from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
 import numpy as np
 import pandas as pd
 import xarray as xr
-from sklearn.neighbors import NearestNeighbors
+from scipy.spatial import cKDTree
 
 from starfish.core.compat import blob_dog, blob_log
 from starfish.core.image.Filter.util import determine_axes_to_group_by
@@ -110,7 +110,7 @@ class LocalSearchBlobDetector(DetectSpotsAlgorithm):
         self.detector_kwargs = detector_kwargs
         try:
             self.detector_method = blob_detectors[detector_method]
-        except ValueError:
+        except KeyError:
             raise ValueError(f"Detector method must be one of {list(blob_detectors.keys())}")
 
     def _spot_finder(self, data: xr.DataArray) -> pd.DataFrame:
@@ -296,14 +296,16 @@ class LocalSearchBlobDetector(DetectSpotsAlgorithm):
             query_df = round_dataframes[r]
             query_coordinates = query_df[[Axes.ZPLANE, Axes.Y, Axes.X]]
 
-            # Build the classifier; chose NN over radius neighbors because data structures are
-            # amenable to vectorization, which improves execution time.
-            # TODO ambrosejcarr use n_neighbors > 1 to break ties, enable codebook-based finding
+            # Build a KD-tree over the query round; chose NN over radius neighbors because data
+            # structures are amenable to vectorization, which improves execution time. cKDTree
+            # answers the same query as NearestNeighbors, which also used a tree here, with less
+            # per-call wrapper overhead.
+            # TODO ambrosejcarr use k > 1 to break ties, enable codebook-based finding
             #      use additional axes in dist, ind to retain vectorization.
-            nn = NearestNeighbors(n_neighbors=1)
-            nn.fit(query_coordinates)
-
-            distances, indices = nn.kneighbors(reference_coordinates)
+            #      Note that cKDTree may resolve equidistant ties to a different spot than
+            #      NearestNeighbors did.
+            tree = cKDTree(query_coordinates.values)
+            distances, indices = tree.query(reference_coordinates.values, k=1)
             dist[r] = distances
             ind[r] = indices
 
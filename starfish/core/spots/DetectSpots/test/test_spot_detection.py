@@ -13,6 +13,7 @@ from .._base import DetectSpotsAlgorithm
 from ..blob import BlobDetector
 from ..detect import detect_spots
 from ..local_max_peak_finder import LocalMaxPeakFinder
+from ..local_search_blob_detector import LocalSearchBlobDetector
 from ..trackpy_local_max_peak_finder import TrackpyLocalMaxPeakFinder
 
 # verify all spot finders handle different coding types
@@ -163,6 +164,46 @@ def test_spot_finding_no_reference_image(
     assert empty_intensity_table.sizes[Features.AXIS] == 0
 
 
+@pytest.mark.parametrize(
+    'data_stack, max_intensity',
+    [
+        (ONE_HOT_IMAGESTACK, ONE_HOT_MAX_INTENSITY),
+        (SPARSE_IMAGESTACK, SPARSE_MAX_INTENSITY),
+        (BLANK_IMAGESTACK, BLANK_MAX_INTENSITY),
+    ]
+)
+def test_blob_dog_spot_detection(data_stack: ImageStack, max_intensity: float):
+    """blob_dog does not accept num_sigma; verify that BlobDetector can still use it to find the
+    spots."""
+    spot_detector = BlobDetector(
+        min_sigma=1, max_sigma=4, num_sigma=5, threshold=0, measurement_type='max',
+        detector_method='blob_dog',
+    )
+
+    intensity_table = detect_spots(
+        data_stack=data_stack,
+        spot_finding_method=spot_detector.image_to_spots,
+        reference_image=data_stack,
+        reference_image_max_projection_axes=(Axes.ROUND, Axes.CH),
+        measurement_function=np.max,
+        radius_is_gyration=False,
+        n_processes=1,
+    )
+    assert intensity_table.sizes[Features.AXIS] == 2, "wrong number of spots detected"
+    expected = [max_intensity * 2, max_intensity * 2]
+    assert np.allclose(intensity_table.sum((Axes.ROUND, Axes.CH)).values, expected), \
+        "wrong spot intensities detected"
+
+
+def test_unknown_detector_method():
+    """An unknown detector_method should be rejected when the detector is constructed."""
+    with pytest.raises(ValueError):
+        BlobDetector(min_sigma=1, max_sigma=4, num_sigma=5, threshold=0, detector_method='blob')
+    with pytest.raises(ValueError):
+        LocalSearchBlobDetector(
+            min_sigma=1, max_sigma=4, num_sigma=5, threshold=0, detector_method='blob')
+
+
 def _make_labeled_image() -> ImageStack:
     ROUND_LABELS = (1, 4, 6)
     CH_LABELS = (2, 4, 6, 8)
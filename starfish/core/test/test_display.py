@@ -22,7 +22,7 @@ sd = SyntheticData(
 stack = sd.spots()
 spots = sd.intensities()
 masks = SegmentationMaskCollection.from_label_image(
-    np.random.rand(128, 128).astype(np.uint8),
+    np.random.RandomState(0).randint(0, 256, size=(128, 128), dtype=np.uint8),
     {Coordinates.Y: np.arange(128), Coordinates.X: np.arange(128)}
 )
 